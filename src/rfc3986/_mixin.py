@@ -1,8 +1,11 @@
 """Module containing the implementation of the URIMixin class."""
 
+import functools
+import types
 import typing as t
 import warnings
 
+from . import abnf_regexp
 from . import exceptions as exc
 from . import misc
 from . import normalizers
@@ -19,6 +22,95 @@ class _AuthorityInfo(t.TypedDict):
     port: t.Optional[str]
 
 
+# Shared by every reference without an authority. Read-only so that it cannot
+# be changed for all of them at once.
+_EMPTY_AUTHORITY_INFO = t.cast(
+    _AuthorityInfo,
+    types.MappingProxyType({"userinfo": None, "host": None, "port": None}),
+)
+
+_BARE_HOST_CHARS = frozenset(abnf_regexp.ALPHA + abnf_regexp.DIGIT + ".-")
+
+
+def _split_bare_authority(authority: str) -> t.Optional[_AuthorityInfo]:
+    # Most authorities are a plain ``host`` or ``host:port``. Those can be
+    # split without running the sub-authority regular expression. Anything
+    # else (userinfo, IP literals, percent-encoding, non-ASCII) returns None.
+    host, colon, port = authority.partition(":")
+    if not (host and _BARE_HOST_CHARS.issuperset(host)):
+        return None
+    if colon and not (port.isascii() and port.isdigit() and len(port) <= 5):
+        return None
+    return {"userinfo": None, "host": host, "port": port or None}
+
+
+def _split_subauthority(
+    matcher: t.Pattern[str],
+    authority: str,
+) -> t.Optional[_AuthorityInfo]:
+    """Split an authority into its userinfo, host, and port.
+
+    :returns:
+        The sub-components of the authority or ``None`` if ``matcher`` cannot
+        parse the authority or the host is not a valid IPv4 address.
+    """
+    matches = _split_bare_authority(authority)
+    if matches is None:
+        match = matcher.fullmatch(authority)
+        if match is None:
+            return None
+        matches = match.groupdict()
+
+    # We had a match, now let's ensure that it is actually a valid host
+    # address if it is IPv4
+    host = matches.get("host")
+
+    if (
+        host
+        and misc.IPv4_MATCHER.match(host)
+        and not validators.valid_ipv4_host_address(host)
+    ):
+        # If we have a host, it appears to be IPv4 and it does not have
+        # valid bytes, it is an InvalidAuthority.
+        return None
+
+    return matches
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_authority(authority: str) -> t.Optional[_AuthorityInfo]:
+    return _split_subauthority(misc.SUBAUTHORITY_MATCHER, authority)
+
+
+_Components = t.Tuple[
+    t.Optional[str],
+    t.Optional[str],
+    t.Optional[str],
+    t.Optional[str],
+    t.Optional[str],
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_reference(
+    matcher: t.Pattern[str],
+    reference: str,
+    encoding: str,
+) -> _Components:
+    # URI_MATCHER and IRI_MATCHER only capture the five components, in order,
+    # so we can unpack them positionally instead of building a dictionary.
+    scheme, authority, path, query, fragment = matcher.match(
+        reference
+    ).groups()
+    return (
+        scheme,
+        authority,
+        normalizers.encode_component(path, encoding),
+        normalizers.encode_component(query, encoding),
+        normalizers.encode_component(fragment, encoding),
+    )
+
+
 class URIMixin:
     """Mixin with all shared methods for URIs and IRIs."""
 
@@ -30,6 +122,14 @@ class URIMixin:
         fragment: t.Optional[str]
         encoding: str
 
+        @classmethod
+        def from_string(  # noqa: D102
+            cls,
+            uri_string: t.Union[str, bytes],
+            encoding: str = "utf-8",
+            /,
+        ) -> _Self: ...
+
     def authority_info(self) -> _AuthorityInfo:
         """Return a dictionary with the ``userinfo``, ``host``, and ``port``.
 
@@ -43,36 +143,27 @@ class URIMixin:
         :raises rfc3986.exceptions.InvalidAuthority:
             If the authority is not ``None`` and can not be parsed.
         """
+        return self._authority_info().copy()
+
+    def _authority_info(self) -> _AuthorityInfo:
+        # Shared, memoized variant of authority_info(). The result must not
+        # be mutated by callers.
         if not self.authority:
-            return {"userinfo": None, "host": None, "port": None}
+            return _EMPTY_AUTHORITY_INFO
 
-        match = self._match_subauthority()
+        info = self._parse_subauthority()
 
-        if match is None:
+        if info is None:
             # In this case, we have an authority that was parsed from the URI
             # Reference, but it cannot be further parsed by our
-            # misc.SUBAUTHORITY_MATCHER. In this case it must not be a valid
-            # authority.
+            # misc.SUBAUTHORITY_MATCHER or it has an invalid IPv4 host. In
+            # this case it must not be a valid authority.
             raise exc.InvalidAuthority(self.authority.encode(self.encoding))
 
-        # We had a match, now let's ensure that it is actually a valid host
-        # address if it is IPv4
-        matches = match.groupdict()
-        host = matches.get("host")
-
-        if (
-            host
-            and misc.IPv4_MATCHER.match(host)
-            and not validators.valid_ipv4_host_address(host)
-        ):
-            # If we have a host, it appears to be IPv4 and it does not have
-            # valid bytes, it is an InvalidAuthority.
-            raise exc.InvalidAuthority(self.authority.encode(self.encoding))
+        return info
 
-        return matches
-
-    def _match_subauthority(self) -> t.Optional[t.Match[str]]:
-        return misc.SUBAUTHORITY_MATCHER.match(self.authority)
+    def _parse_subauthority(self) -> t.Optional[_AuthorityInfo]:
+        return _parse_authority(self.authority)
 
     @property
     def _validator(self) -> validators.Validator:
@@ -88,7 +179,7 @@ class URIMixin:
     def host(self) -> t.Optional[str]:
         """If present, a string representing the host."""
         try:
-            authority = self.authority_info()
+            authority = self._authority_info()
         except exc.InvalidAuthority:
             return None
         return authority["host"]
@@ -97,7 +188,7 @@ class URIMixin:
     def port(self) -> t.Optional[str]:
         """If present, the port extracted from the authority."""
         try:
-            authority = self.authority_info()
+            authority = self._authority_info()
         except exc.InvalidAuthority:
             return None
         return authority["port"]
@@ -106,7 +197,7 @@ class URIMixin:
     def userinfo(self) -> t.Optional[str]:
         """If present, the userinfo extracted from the authority."""
         try:
-            authority = self.authority_info()
+            authority = self._authority_info()
         except exc.InvalidAuthority:
             return None
         return authority["userinfo"]
@@ -146,14 +237,26 @@ class URIMixin:
             "This method will be eventually removed.",
             DeprecationWarning,
         )
-        validators = [
-            (self.scheme_is_valid, kwargs.get("require_scheme", False)),
-            (self.authority_is_valid, kwargs.get("require_authority", False)),
-            (self.path_is_valid, kwargs.get("require_path", False)),
-            (self.query_is_valid, kwargs.get("require_query", False)),
-            (self.fragment_is_valid, kwargs.get("require_fragment", False)),
-        ]
-        return all(v(r) for v, r in validators)
+        # Call the validators directly rather than through the deprecated
+        # *_is_valid methods so that we only warn once. They are ordered from
+        # cheapest to most expensive so an invalid URI fails fast.
+        return (
+            validators.scheme_is_valid(
+                self.scheme, kwargs.get("require_scheme", False)
+            )
+            and validators.query_is_valid(
+                self.query, kwargs.get("require_query", False)
+            )
+            and validators.fragment_is_valid(
+                self.fragment, kwargs.get("require_fragment", False)
+            )
+            and validators.path_is_valid(
+                self.path, kwargs.get("require_path", False)
+            )
+            and self._authority_is_valid(
+                kwargs.get("require_authority", False)
+            )
+        )
 
     def authority_is_valid(self, require: bool = False) -> bool:
         """Determine if the authority component is valid.
@@ -174,8 +277,11 @@ class URIMixin:
             "This method will be eventually removed.",
             DeprecationWarning,
         )
+        return self._authority_is_valid(require)
+
+    def _authority_is_valid(self, require: bool) -> bool:
         try:
-            self.authority_info()
+            self._authority_info()
         except exc.InvalidAuthority:
             return False
 
@@ -261,6 +367,20 @@ class URIMixin:
         )
         return validators.fragment_is_valid(self.fragment, require)
 
+    def _coerce(self, other: object) -> _Self:
+        # Turn the other side of a comparison into a reference of our type.
+        # References are tuples too, so they are rebuilt here as well, which
+        # normalizes empty components and sets the encoding.
+        if isinstance(other, tuple):
+            return t.cast("t.Callable[..., _Self]", type(self))(*other)
+        try:
+            return type(self).from_string(other)
+        except TypeError:
+            raise TypeError(
+                f"Unable to compare {type(self).__name__}() to "
+                f"{type(other).__name__}()"
+            )
+
     def normalized_equality(self, other_ref: "uri.URIReference") -> bool:
         """Compare this URIReference to another URIReference.
 
@@ -269,7 +389,7 @@ class URIMixin:
         :returns: ``True`` if the references are equal, ``False`` otherwise.
         :rtype: bool
         """
-        return tuple(self.normalize()) == tuple(other_ref.normalize())
+        return tuple.__eq__(self.normalize(), other_ref.normalize())
 
     def resolve_with(  # noqa: C901
         self,
@@ -292,10 +412,9 @@ class URIMixin:
             If the ``base_uri`` does not at least have a scheme.
         """
         if not isinstance(base_uri, URIMixin):
-            base_uri = type(self).from_string(base_uri)
-
-        if t.TYPE_CHECKING:
-            base_uri = t.cast(uri.URIReference, base_uri)
+            base_uri = t.cast(
+                "uri.URIReference", type(self).from_string(base_uri)
+            )
 
         try:
             self._validator.validate(base_uri)
@@ -357,18 +476,24 @@ class URIMixin:
         :rtype: str
         """
         # See http://tools.ietf.org/html/rfc3986#section-5.3
-        result_list: list[str] = []
-        if self.scheme:
-            result_list.extend([self.scheme, ":"])
-        if self.authority:
-            result_list.extend(["//", self.authority])
-        if self.path:
-            result_list.append(self.path)
-        if self.query is not None:
-            result_list.extend(["?", self.query])
-        if self.fragment is not None:
-            result_list.extend(["#", self.fragment])
-        return "".join(result_list)
+        return (
+            (f"{self.scheme}:" if self.scheme else "")
+            + (f"//{self.authority}" if self.authority else "")
+            + (self.path or "")
+            + (f"?{self.query}" if self.query is not None else "")
+            + (f"#{self.fragment}" if self.fragment is not None else "")
+        )
+
+    def __str__(self) -> str:
+        """Return the reference as a string, as created by :meth:`unsplit`.
+
+        The result is computed once and cached since references are
+        immutable.
+        """
+        unsplit = getattr(self, "_cached_str", None)
+        if unsplit is None:
+            unsplit = self._cached_str = self.unsplit()
+        return unsplit
 
     def copy_with(
         self,
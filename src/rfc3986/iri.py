@@ -14,6 +14,7 @@
 # implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import typing as t
 
 from . import compat
@@ -21,6 +22,9 @@ from . import exceptions
 from . import misc
 from . import normalizers
 from . import uri
+from ._mixin import _AuthorityInfo
+from ._mixin import _split_reference
+from ._mixin import _split_subauthority
 from ._typing_compat import Self as _Self
 
 try:
@@ -29,6 +33,22 @@ except ImportError:  # pragma: no cover
     idna = None
 
 
+@functools.lru_cache(maxsize=512)
+def _idna_encode(name: str) -> str:
+    # Default encoder for a single label of an IRI host.
+    if name.isascii():
+        return name
+    assert idna  # Known to not be None at this point.
+    return idna.encode(name.lower(), strict=True, std3_rules=True).decode(
+        "ascii"
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iauthority(authority: str) -> t.Optional[_AuthorityInfo]:
+    return _split_subauthority(misc.ISUBAUTHORITY_MATCHER, authority)
+
+
 class IRIReference(misc.URIReferenceBase, uri.URIMixin):
     """Immutable object representing a parsed IRI Reference.
 
@@ -67,24 +87,13 @@ class IRIReference(misc.URIReferenceBase, uri.URIMixin):
 
     def __eq__(self, other: object) -> bool:
         """Compare this reference to another."""
-        other_ref = other
-        if isinstance(other, tuple):
-            other_ref = type(self)(*other)
-        elif not isinstance(other, IRIReference):
-            try:
-                other_ref = self.from_string(other)
-            except TypeError:
-                raise TypeError(
-                    "Unable to compare {}() to {}()".format(
-                        type(self).__name__, type(other).__name__
-                    )
-                )
+        other_ref = self._coerce(other)
 
         # See http://tools.ietf.org/html/rfc3986#section-6.2
-        return tuple(self) == tuple(other_ref)
+        return tuple.__eq__(self, other_ref)
 
-    def _match_subauthority(self) -> t.Optional[t.Match[str]]:
-        return misc.ISUBAUTHORITY_MATCHER.match(self.authority)
+    def _parse_subauthority(self) -> t.Optional[_AuthorityInfo]:
+        return _parse_iauthority(self.authority)
 
     @classmethod
     def from_string(
@@ -100,19 +109,14 @@ class IRIReference(misc.URIReferenceBase, uri.URIMixin):
         """
         iri_string = compat.to_str(iri_string, encoding)
 
-        split_iri = misc.IRI_MATCHER.match(iri_string).groupdict()
         return cls(
-            split_iri["scheme"],
-            split_iri["authority"],
-            normalizers.encode_component(split_iri["path"], encoding),
-            normalizers.encode_component(split_iri["query"], encoding),
-            normalizers.encode_component(split_iri["fragment"], encoding),
+            *_split_reference(misc.IRI_MATCHER, iri_string, encoding),
             encoding,
         )
 
     def encode(  # noqa: C901
         self,
-        idna_encoder: t.Optional[  # pyright: ignore[reportRedeclaration]
+        idna_encoder: t.Optional[
             t.Callable[[str], t.Union[str, bytes]]
         ] = None,
     ) -> "uri.URIReference":
@@ -138,36 +142,43 @@ class IRIReference(misc.URIReferenceBase, uri.URIMixin):
                         "and the IRI hostname requires encoding"
                     )
 
-                def idna_encoder(name: str) -> t.Union[str, bytes]:
-                    assert idna  # Known to not be None at this point.
-
-                    if any(ord(c) > 128 for c in name):
+            host = self.host
+            authority = ""
+            if host:
+                if idna_encoder is None:
+                    if host.isascii():
+                        # Nothing in an ASCII host needs IDNA encoding.
+                        authority = host
+                    else:
+                        assert idna
                         try:
-                            return idna.encode(
-                                name.lower(), strict=True, std3_rules=True
+                            authority = ".".join(
+                                [
+                                    _idna_encode(part)
+                                    for part in host.split(".")
+                                ]
                             )
                         except idna.IDNAError:
                             raise exceptions.InvalidAuthority(self.authority)
-                    return name
-
-            authority = ""
-            if self.host:
-                authority = ".".join(
-                    [
-                        compat.to_str(idna_encoder(part))
-                        for part in self.host.split(".")
-                    ]
-                )
+                else:
+                    authority = ".".join(
+                        [
+                            compat.to_str(idna_encoder(part))
+                            for part in host.split(".")
+                        ]
+                    )
 
-            if self.userinfo is not None:
+            userinfo = self.userinfo
+            if userinfo is not None:
                 authority = (
-                    normalizers.encode_component(self.userinfo, self.encoding)
+                    normalizers.encode_component(userinfo, self.encoding)
                     + "@"
                     + authority
                 )
 
-            if self.port is not None:
-                authority += ":" + str(self.port)
+            port = self.port
+            if port is not None:
+                authority += ":" + str(port)
 
         return uri.URIReference(
             self.scheme,
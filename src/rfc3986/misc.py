@@ -87,6 +87,10 @@ FRAGMENT_MATCHER = QUERY_MATCHER
 
 # Scheme validation, see: http://tools.ietf.org/html/rfc3986#section-3.1
 SCHEME_MATCHER = re.compile(f"^{abnf_regexp.SCHEME_RE}$")
+# Character sets equivalent to SCHEME_MATCHER, for validating schemes without
+# the overhead of a regular expression.
+SCHEME_FIRST_CHARS = frozenset(abnf_regexp.ALPHA)
+SCHEME_CHARS = frozenset(abnf_regexp.ALPHA + abnf_regexp.DIGIT + "+.-")
 
 RELATIVE_REF_MATCHER = re.compile(
     r"^%s(\?%s)?(#%s)?$"
@@ -165,6 +165,17 @@ def remove_dot_segments(s: str) -> str:
     return "/".join(output)
 
 
+# The encoded form of every byte value, indexed by the byte. The second table
+# leaves '%' alone for components that are already percent-encoded.
+_ENCODED_BYTES = tuple(
+    chr(byte) if chr(byte) in misc.NON_PCT_ENCODED else f"%{byte:02X}"
+    for byte in range(256)
+)
+_PERCENT_ENCODED_BYTES = (
+    _ENCODED_BYTES[: ord("%")] + ("%",) + _ENCODED_BYTES[ord("%") + 1 :]
+)
+
+
 @t.overload
 def encode_component(uri_component: None, encoding: str) -> None:  # noqa: D103
     ...
@@ -183,6 +194,10 @@ def encode_component(
     if uri_component is None:
         return uri_component
 
+    # Most components contain nothing that needs encoding.
+    if misc.NON_PCT_ENCODED.issuperset(uri_component):
+        return compat.to_str(uri_component, encoding)
+
     # Try to see if the component we're encoding is already percent-encoded
     # so we can skip all '%' characters but still encode all others.
     percent_encodings = len(
@@ -192,17 +207,8 @@ def encode_component(
     uri_bytes = compat.to_bytes(uri_component, encoding)
     is_percent_encoded = percent_encodings == uri_bytes.count(b"%")
 
-    encoded_uri = bytearray()
-
-    for i in range(0, len(uri_bytes)):
-        # Will return a single character bytestring on both Python 2 & 3
-        byte = uri_bytes[i : i + 1]
-        byte_ord = ord(byte)
-        if (is_percent_encoded and byte == b"%") or (
-            byte_ord < 128 and byte.decode() in misc.NON_PCT_ENCODED
-        ):
-            encoded_uri.extend(byte)
-            continue
-        encoded_uri.extend(f"%{byte_ord:02x}".encode().upper())
-
-    return encoded_uri.decode(encoding)
+    if is_percent_encoded:
+        table = _PERCENT_ENCODED_BYTES
+    else:
+        table = _ENCODED_BYTES
+    return "".join([table[byte] for byte in uri_bytes])
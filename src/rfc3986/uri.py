@@ -20,6 +20,7 @@ from . import compat
 from . import misc
 from . import normalizers
 from ._mixin import URIMixin
+from ._mixin import _split_reference
 from ._typing_compat import Self as _Self
 
 
@@ -104,25 +105,15 @@ class URIReference(misc.URIReferenceBase, URIMixin):
         ref.encoding = encoding
         return ref
 
+    # Not memoized: tuple.__hash__ is cheaper than a cached lookup.
     __hash__ = tuple.__hash__
 
     def __eq__(self, other: object) -> bool:
         """Compare this reference to another."""
-        other_ref = other
-        if isinstance(other, tuple):
-            other_ref = type(self)(*other)
-        elif not isinstance(other, URIReference):
-            try:
-                other_ref = self.from_string(other)
-            except TypeError:
-                raise TypeError(
-                    "Unable to compare {}() to {}()".format(
-                        type(self).__name__, type(other).__name__
-                    )
-                )
+        other_ref = self._coerce(other)
 
         # See http://tools.ietf.org/html/rfc3986#section-6.2
-        naive_equality = tuple(self) == tuple(other_ref)
+        naive_equality = tuple.__eq__(self, other_ref)
         return naive_equality or self.normalized_equality(other_ref)
 
     def normalize(self) -> "URIReference":
@@ -160,13 +151,7 @@ class URIReference(misc.URIReferenceBase, URIMixin):
         :returns: :class:`URIReference` or subclass thereof
         """
         uri_string = compat.to_str(uri_string, encoding)
-
-        split_uri = misc.URI_MATCHER.match(uri_string).groupdict()
         return cls(
-            split_uri["scheme"],
-            split_uri["authority"],
-            normalizers.encode_component(split_uri["path"], encoding),
-            normalizers.encode_component(split_uri["query"], encoding),
-            normalizers.encode_component(split_uri["fragment"], encoding),
+            *_split_reference(misc.URI_MATCHER, uri_string, encoding),
             encoding,
         )
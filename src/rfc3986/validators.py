@@ -290,10 +290,10 @@ def is_valid(
         Whether or not the value is required.
     """
     if require:
-        return value is not None and bool(matcher.match(value))
+        return value is not None and bool(matcher.fullmatch(value))
 
     # require is False and value is not None
-    return value is None or bool(matcher.match(value))
+    return value is None or bool(matcher.fullmatch(value))
 
 
 def authority_is_valid(
@@ -352,7 +352,12 @@ def scheme_is_valid(scheme: t.Optional[str], require: bool = False) -> bool:
     :rtype:
         bool
     """
-    return is_valid(scheme, misc.SCHEME_MATCHER, require)
+    if scheme is None:
+        return not require
+    return (
+        scheme[:1] in misc.SCHEME_FIRST_CHARS
+        and misc.SCHEME_CHARS.issuperset(scheme)
+    )
 
 
 def path_is_valid(path: t.Optional[str], require: bool = False) -> bool:
@@ -64,46 +64,80 @@ equivalent_schemes_and_hostnames = list(
 )
 
 
-@pytest.fixture(params=valid_hosts)
+# Build every parametrized URI once, at collection time, rather than
+# formatting it in each fixture invocation.
+basic_uris = [f"http://{host}" for host in valid_hosts]
+uris_to_normalize = [
+    f"{scheme}://{host}" for scheme, host in equivalent_schemes_and_hostnames
+]
+basic_uris_with_port = [f"ftp://{host}:21" for host in valid_hosts]
+uris_with_port_and_userinfo = [
+    f"ssh://user:pass@{host}:22" for host in valid_hosts
+]
+uris_with_port_and_tricky_userinfo = [
+    f"ssh://user%20!=:pass@{host}:22" for host in valid_hosts
+]
+basic_uris_with_path = [
+    f"http://{host}/path/to/resource" for host in valid_hosts
+]
+uris_with_path_and_query = [
+    f"http://{host}/path/to/resource?key=value" for host in valid_hosts
+]
+uris_with_everything = [
+    f"https://user:pass@{host}:443/path/to/resource?key=value#fragment"
+    for host in valid_hosts
+]
+relative_uris = [f"//{host}" for host in valid_hosts]
+invalid_uris = [f"https://{host}" for host in invalid_hosts]
+uris_path_with_percent = [f"https://{host}/% " for host in valid_hosts]
+uris_query_with_percent = [f"https://{host}?a=%" for host in valid_hosts]
+uris_fragment_with_percent = [
+    f"https://{host}#perc%ent" for host in valid_hosts
+]
+uris_fragment_with_line_terminators = [
+    f"https://{host}#\nfrag\nment\n" for host in valid_hosts
+]
+schemes_only = [f"{scheme}:" for scheme in equivalent_schemes]
+
+
+@pytest.fixture(params=basic_uris)
 def basic_uri(request):
-    return "http://%s" % request.param
+    return request.param
 
 
-@pytest.fixture(params=equivalent_schemes_and_hostnames)
+@pytest.fixture(params=uris_to_normalize)
 def uri_to_normalize(request):
-    return "%s://%s" % request.param
+    return request.param
 
 
-@pytest.fixture(params=valid_hosts)
+@pytest.fixture(params=basic_uris_with_port)
 def basic_uri_with_port(request):
-    return "ftp://%s:21" % request.param
+    return request.param
 
 
-@pytest.fixture(params=valid_hosts)
+@pytest.fixture(params=uris_with_port_and_userinfo)
 def uri_with_port_and_userinfo(request):
-    return "ssh://user:pass@%s:22" % request.param
+    return request.param
 
 
-@pytest.fixture(params=valid_hosts)
+@pytest.fixture(params=uris_with_port_and_tricky_userinfo)
 def uri_with_port_and_tricky_userinfo(request):
-    return "ssh://{}@{}:22".format("user%20!=:pass", request.param)
+    return request.param
 
 
-@pytest.fixture(params=valid_hosts)
+@pytest.fixture(params=basic_uris_with_path)
 def basic_uri_with_path(request):
-    return "http://%s/path/to/resource" % request.param
+    return request.param
 
 
-@pytest.fixture(params=valid_hosts)
+@pytest.fixture(params=uris_with_path_and_query)
 def uri_with_path_and_query(request):
-    return "http://%s/path/to/resource?key=value" % request.param
+    return request.param
 
 
-@pytest.fixture(params=valid_hosts)
+@pytest.fixture(params=uris_with_everything)
 def uri_with_everything(request):
-    return "https://user:pass@%s:443/path/to/resource?key=value#fragment" % (
-        request.param
-    )
+    return request.param
 
 
 @pytest.fixture
@@ -126,9 +160,9 @@ def uri_with_port_but_no_colon():
     return "scheme://user@[v12.ip]8000/path"
 
 
-@pytest.fixture(params=valid_hosts)
+@pytest.fixture(params=relative_uris)
 def relative_uri(request):
-    return "//%s" % request.param
+    return request.param
 
 
 @pytest.fixture
@@ -136,34 +170,34 @@ def absolute_path_uri():
     return "/path/to/file"
 
 
-@pytest.fixture(params=invalid_hosts)
+@pytest.fixture(params=invalid_uris)
 def invalid_uri(request):
-    return "https://%s" % request.param
+    return request.param
 
 
-@pytest.fixture(params=valid_hosts)
+@pytest.fixture(params=uris_path_with_percent)
 def uri_path_with_percent(request):
-    return "https://%s/%% " % request.param
+    return request.param
 
 
-@pytest.fixture(params=valid_hosts)
+@pytest.fixture(params=uris_query_with_percent)
 def uri_query_with_percent(request):
-    return "https://%s?a=%%" % request.param
+    return request.param
 
 
-@pytest.fixture(params=valid_hosts)
+@pytest.fixture(params=uris_fragment_with_percent)
 def uri_fragment_with_percent(request):
-    return "https://%s#perc%%ent" % request.param
+    return request.param
 
 
-@pytest.fixture(params=valid_hosts)
+@pytest.fixture(params=uris_fragment_with_line_terminators)
 def uri_fragment_with_line_terminators(request):
-    return "https://%s#\nfrag\nment\n" % request.param
+    return request.param
 
 
-@pytest.fixture(params=equivalent_schemes)
+@pytest.fixture(params=schemes_only)
 def scheme_only(request):
-    return "%s:" % request.param
+    return request.param
 
 
 sys.path.insert(0, ".")
@@ -43,6 +43,16 @@ def test_encode_iri(iri, uri):
     assert rfc3986.iri_reference(iri).encode().unsplit() == uri
 
 
+def test_encode_iri_with_custom_encoder():
+    iri_ref = rfc3986.iri_reference("http://user@Bücher.de:80/path")
+
+    def encoder(name):
+        return name.upper().encode("utf-8")
+
+    uri_ref = iri_ref.encode(idna_encoder=encoder)
+    assert uri_ref.unsplit() == "http://user@BÜCHER.DE:80/path"
+
+
 @iri_to_uri
 def test_iri_equality(iri, uri):
     assert rfc3986.iri_reference(iri) == iri
@@ -61,6 +71,19 @@ def test_iri_equality_special_cases():
         rfc3986.iri_reference("http://ẞ.com") == 1
 
 
+def test_iri_equality_with_iri_reference():
+    iri = "http://Bü:ẞ@βόλος.com/β/ό?λ#ος"
+    assert rfc3986.iri_reference(iri) == rfc3986.iri_reference(iri)
+    assert rfc3986.iri_reference(iri) != rfc3986.iri_reference("http://ẞ.com")
+
+
+def test_iri_equality_normalizes_empty_components():
+    iri = rfc3986.iri_reference("http://example.com")
+    assert iri == iri.copy_with(path="")
+    relative = rfc3986.iri_reference("//example.com")
+    assert relative == relative.copy_with(scheme="")
+
+
 @requires_idna
 @pytest.mark.parametrize(
     "iri",
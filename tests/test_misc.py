@@ -1,3 +1,10 @@
+import pytest
+
+from rfc3986.misc import HOST_MATCHER
+from rfc3986.misc import IRI_MATCHER
+from rfc3986.misc import ISUBAUTHORITY_MATCHER
+from rfc3986.misc import SUBAUTHORITY_MATCHER
+from rfc3986.misc import URI_MATCHER
 from rfc3986.misc import merge_paths
 from rfc3986.uri import URIReference
 
@@ -48,3 +55,46 @@ def test_merge_paths_with_base_authority_without_path():
     )
     expected = "/relative"
     assert merge_paths(base, "relative") == expected
+
+
+@pytest.mark.parametrize(
+    "matcher",
+    [URI_MATCHER, IRI_MATCHER],
+    ids=["URI_MATCHER", "IRI_MATCHER"],
+)
+def test_matcher_only_captures_components(matcher):
+    """from_string relies on the order of these groups."""
+    assert matcher.groups == 5
+    assert list(matcher.groupindex) == [
+        "scheme",
+        "authority",
+        "path",
+        "query",
+        "fragment",
+    ]
+
+
+@pytest.mark.parametrize(
+    "authority",
+    [
+        "a:" * 10000 + "@[",
+        "%" * 10000,
+        "[" + "1:" * 10000 + "]",
+        "a" * 10000 + "@" + "b" * 10000 + "/",
+        "%aa" * 10000 + "/",
+    ],
+    ids=["colons", "percents", "ipv6", "userinfo", "pct-encoded"],
+)
+@pytest.mark.parametrize(
+    "matcher",
+    [SUBAUTHORITY_MATCHER, ISUBAUTHORITY_MATCHER, HOST_MATCHER],
+    ids=["SUBAUTHORITY_MATCHER", "ISUBAUTHORITY_MATCHER", "HOST_MATCHER"],
+)
+def test_authority_matchers_reject_pathological_input(matcher, authority):
+    """Guard against catastrophic backtracking on long invalid authorities.
+
+    Any regression here shows up as this test hanging rather than failing.
+    """
+    assert matcher.match(authority) is None
+    uri = URI_MATCHER.match("http://" + authority)
+    assert uri.group("authority") == authority.rstrip("/")
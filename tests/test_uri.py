@@ -2,6 +2,9 @@ import pytest
 
 from rfc3986.exceptions import InvalidAuthority
 from rfc3986.exceptions import ResolutionError
+from rfc3986.iri import IRIReference
+from rfc3986.misc import ISUBAUTHORITY_MATCHER
+from rfc3986.misc import SUBAUTHORITY_MATCHER
 from rfc3986.misc import URI_MATCHER
 from rfc3986.uri import URIReference
 
@@ -31,6 +34,21 @@ class TestURIReferenceParsesURIs(base.BaseTestParsesURIs):
         assert uri.userinfo is None
         assert uri.port is None
 
+    def test_authority_info_is_not_shared(self, uri_with_everything):
+        """Verify mutating authority_info() does not leak into the cache."""
+        uri = URIReference.from_string(uri_with_everything)
+        info = uri.authority_info()
+        info["host"] = "mutated.example.com"
+        assert uri.authority_info()["host"] != "mutated.example.com"
+        assert uri.host != "mutated.example.com"
+
+    def test_empty_authority_info_is_not_shared(self, absolute_path_uri):
+        uri = URIReference.from_string(absolute_path_uri)
+        info = uri.authority_info()
+        info["host"] = "mutated.example.com"
+        assert uri.authority_info()["host"] is None
+        assert uri.host is None
+
     def test_handles_absolute_path_uri(self, absolute_path_uri):
         """Test that URIReference can handle a path-only URI."""
         uri = URIReference.from_string(absolute_path_uri)
@@ -64,6 +82,42 @@ class TestURIReferenceParsesURIs(base.BaseTestParsesURIs):
         assert uri.path == "[::1]"
 
 
+@pytest.mark.parametrize(
+    "authority",
+    [
+        "example.com",
+        "example.com:8080",
+        "example.com\n",
+        "EXAMPLE.com:0",
+        "127.0.0.1:80",
+        "localhost:",
+        "localhost:123456",
+        "localhost:80:80",
+        "localhost:٨٠",
+        "user@localhost",
+        "[::1]:443",
+        "%2Fvar%2Frun%2Fsocket",
+        ":80",
+    ],
+)
+@pytest.mark.parametrize(
+    ("reference_class", "matcher"),
+    [
+        (URIReference, SUBAUTHORITY_MATCHER),
+        (IRIReference, ISUBAUTHORITY_MATCHER),
+    ],
+)
+def test_authority_info_matches_regex(reference_class, matcher, authority):
+    """Verify the bare authority fast path agrees with the regex."""
+    ref = reference_class(None, authority, None, None, None)
+    match = matcher.fullmatch(authority)
+    if match is None:
+        with pytest.raises(InvalidAuthority):
+            ref.authority_info()
+    else:
+        assert ref.authority_info() == match.groupdict()
+
+
 class TestURIValidation:
     # Valid URI tests
     def test_basic_uri_is_valid(self, basic_uri):
@@ -124,6 +178,27 @@ class TestURIValidation:
         uri = URIReference.from_string(scheme_and_path_uri)
         assert uri.is_valid() is True
 
+    def test_is_valid_warns_once(self, uri_with_everything):
+        uri = URIReference.from_string(uri_with_everything)
+        with pytest.warns(DeprecationWarning) as record:
+            assert uri.is_valid() is True
+        assert len(record) == 1
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "scheme_is_valid",
+            "authority_is_valid",
+            "path_is_valid",
+            "query_is_valid",
+            "fragment_is_valid",
+        ],
+    )
+    def test_component_validity_methods(self, uri_with_everything, method):
+        uri = URIReference.from_string(uri_with_everything)
+        with pytest.warns(DeprecationWarning):
+            assert getattr(uri, method)(require=True) is True
+
     # Invalid URI tests
     def test_invalid_uri_is_not_valid(self, invalid_uri):
         uri = URIReference.from_string(invalid_uri)
@@ -153,6 +228,18 @@ class TestURIReferenceUnsplits(base.BaseTestUnsplits):
         uri = self.test_class.from_string(scheme_and_path_uri)
         assert uri.unsplit() == scheme_and_path_uri
 
+    def test_str_is_unsplit(self, uri_with_everything):
+        uri = self.test_class.from_string(uri_with_everything)
+        assert str(uri) == uri_with_everything
+        assert str(uri) is str(uri)
+
+    def test_str_of_copy_is_not_stale(self, uri_with_everything):
+        uri = self.test_class.from_string(uri_with_everything)
+        assert str(uri) == uri_with_everything
+        copy = uri.copy_with(fragment="other")
+        assert str(copy) == copy.unsplit()
+        assert str(copy).endswith("#other")
+
 
 class TestURIReferenceComparesToStrings:
     def test_basic_uri(self, basic_uri):
@@ -239,6 +326,26 @@ def test_uri_comparison_raises_TypeError(basic_uri):
         uri == 1
 
 
+def test_uri_comparison_to_unhashable_raises_TypeError(basic_uri):
+    uri = URIReference.from_string(basic_uri)
+    with pytest.raises(TypeError):
+        uri == [basic_uri]
+
+
+def test_uri_comparison_to_replaced_reference(basic_uri):
+    uri = URIReference.from_string(basic_uri)
+    assert (uri == uri._replace(path="/y")) is False
+
+
+def test_from_string_respects_encoding():
+    """Verify parsed components are not shared across encodings."""
+    utf8 = URIReference.from_string("http://example.com/\xe9", "utf-8")
+    latin1 = URIReference.from_string("http://example.com/\xe9", "latin-1")
+    assert utf8.path == "/%C3%A9"
+    assert latin1.path == "/%E9"
+    assert latin1.encoding == "latin-1"
+
+
 class TestURIReferenceComparesToURIReferences:
     def test_same_basic_uri(self, basic_uri):
         uri = URIReference.from_string(basic_uri)
@@ -298,3 +298,45 @@ def test_validating_rfc_4007_ipv6_zone_ids():
     assert uri.host == "[::1%25eth0]"
 
     validators.Validator().check_validity_of("host").validate(uri)
+
+
+@pytest.mark.parametrize(
+    ["scheme", "require", "expected"],
+    [
+        ("http", False, True),
+        ("svn+ssh", True, True),
+        ("coap.tcp-v2", True, True),
+        (None, False, True),
+        (None, True, False),
+        ("", False, False),
+        ("1http", False, False),
+        ("ht tp", False, False),
+        ("http\n", False, False),
+        ("htté", False, False),
+    ],
+)
+def test_scheme_is_valid(scheme, require, expected):
+    assert validators.scheme_is_valid(scheme, require) is expected
+
+
+@pytest.mark.parametrize(
+    ["validator", "value"],
+    [
+        (validators.path_is_valid, "/path\n"),
+        (validators.query_is_valid, "key=value\n"),
+        (validators.fragment_is_valid, "fragment\n"),
+        (validators.host_is_valid, "example.com\n"),
+        (validators.authority_is_valid, "example.com:80\n"),
+    ],
+)
+def test_components_with_trailing_newline_are_invalid(validator, value):
+    """Verify the whole component must match, not just a prefix."""
+    assert validator(value) is False
+    assert validator(value.rstrip("\n")) is True
+
+
+def test_authority_with_trailing_newline_is_invalid():
+    uri = rfc3986.uri_reference("http://example.com\n")
+    with pytest.raises(exceptions.InvalidAuthority):
+        uri.authority_info()
+    assert uri.host is None